@@ -1,14 +1,60 @@
 #!/usr/bin/env python3
 import argparse
+import functools
+import itertools
 import json
 import os
 import re
+import string
 import sys
+from typing import Callable, Optional, Tuple
 
 try:
     import pdfplumber
 except ImportError:
-    pdfplumber = None
+    pdfplumber = None  # type: ignore[assignment]
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+PARALLEL_PAGE_THRESHOLD = 8
+# Every worker re-opens and re-parses the PDF, so give each enough pages to pay
+# for that.
+MIN_PAGES_PER_WORKER = 4
+
+# Output keys, in output order. Multi-word literals are not interned by the
+# compiler, so intern them once for cheaper hashing/comparison in batch runs.
+FIELD_NAMES = tuple(
+    sys.intern(name)
+    for name in (
+        "Policy Number",
+        "Policyholder Name",
+        "Incident Date",
+        "Incident Time",
+        "Incident Location",
+        "Incident Description",
+        "Claim Type",
+        "Estimated Damage",
+        "Attachments",
+        "Initial Estimate",
+    )
+)
+
+MANDATORY_FIELDS = (
+    "Policy Number",
+    "Policyholder Name",
+    "Incident Date",
+    "Incident Location",
+    "Claim Type",
+    "Estimated Damage",
+)
 
 DATE_RE = (
     r"(?:0?[1-9]|1[0-2])[\/\-](?:0?[1-9]|[12]\d|3[01])[\/\-](?:\d{2}|\d{4})|"
@@ -21,25 +67,31 @@ DATE_RE = (
 
 TIME_RE = r"(?:[01]?\d|2[0-3]):[0-5]\d(?:\s*[AP]M)?|(?:1[0-2]|0?[1-9])\s*[AP]M"
 
-AMOUNT_RE = r"\$?\s*([0-9]{1,3}(?:,[0-9]{3})*(?:\.\d{2})?|[0-9]+(?:\.\d{2})?)"
+AMOUNT_RE = r"\$?\s*([0-9]{1,3}(?:,[0-9]{3})+(?:\.\d{2})?|[0-9]+(?:\.\d{2})?)"
 
-MISSING_TOKENS = {"n/a", "na", "none", "null", "not provided", "unknown", "-"}
+MISSING_TOKENS = frozenset({"n/a", "na", "none", "null", "not provided", "unknown", "-"})
+_MISSING_MAX_LEN = max(map(len, MISSING_TOKENS))
 
+# Matched against lowercased text, case-sensitively: IGNORECASE would also let
+# "ı" (U+0131) match "i".
 PLACEHOLDER_PATTERNS = [
-    r"\bfirst\b.*\bmiddle\b.*\blast\b",
-    r"\bcity\b.*\bstate\b.*\bzip\b",
-    r"\bname\s*of\s*insured\b",
-    r"\binsured'?s\s*mailing\s*address\b",
-    r"\bphone\b.*\bcell\b",
-    r"\bphone\b",
-    r"\bfax\b",
-    r"\be-?mail\b",
-    r"\bdate\s*of\s*birth\b",
-    r"\bdrivers?\s*license\b",
-    r"\bpolicy\s*number\b",
-    r"\bclaim\s*type\b",
-    r"\bestimate\s*amount\b",
-    r"\bestimated\s*damage\b",
+    re.compile(p)
+    for p in (
+        r"\bfirst\b.*\bmiddle\b.*\blast\b",
+        r"\bcity\b.*\bstate\b.*\bzip\b",
+        r"\bname\s*of\s*insured\b",
+        r"\binsured'?s\s*mailing\s*address\b",
+        r"\bphone\b.*\bcell\b",
+        r"\bphone\b",
+        r"\bfax\b",
+        r"\be-?mail\b",
+        r"\bdate\s*of\s*birth\b",
+        r"\bdrivers?\s*license\b",
+        r"\bpolicy\s*number\b",
+        r"\bclaim\s*type\b",
+        r"\bestimate\s*amount\b",
+        r"\bestimated\s*damage\b",
+    )
 ]
 
 STOP_LABELS = [
@@ -78,62 +130,352 @@ STOP_LABELS = [
     r"Documents\s*Attached",
 ]
 
+_STOP_JOINED = "|".join(STOP_LABELS)
+STOP_LABEL_PATTERNS = [re.compile(p, re.IGNORECASE) for p in STOP_LABELS]
 
-def extract_text(path):
+_PLACEHOLDER_COMBINED = re.compile(
+    "|".join(f"(?:{p.pattern})" for p in PLACEHOLDER_PATTERNS)
+)
+
+_WS_RE = re.compile(r"\s+")
+_BLANKS_RE = re.compile(r"[ \t]+")
+_NEWLINES_RE = re.compile(r"\n{2,}")
+_UPPER_RUN_RE = re.compile(r"[A-Z]{2,}")
+_ASCII_LETTERS = string.ascii_letters.encode()
+_ASCII_UPPER = string.ascii_uppercase.encode()
+# bytes.translate tables mapping every byte outside \w / [A-Za-z] to a space,
+# so split() yields the same tokens as \b-delimited words / [A-Za-z]+ runs.
+_WORD_BYTES = (string.ascii_letters + string.digits + "_").encode()
+_NON_WORD_TO_SPACE = bytes(c if c in _WORD_BYTES else 0x20 for c in range(256))
+_NON_LETTER_TO_SPACE = bytes(c if c in _ASCII_LETTERS else 0x20 for c in range(256))
+_NAME_PLACEHOLDER_WORDS = frozenset({b"first", b"middle", b"last"})
+_NAME_LABEL_WORDS = frozenset({b"insured", b"policy", b"name"})
+_ACORD_RE = re.compile(r"\bACORD\b", re.IGNORECASE)
+_DIGIT_RE = re.compile(r"\d")
+_NAME_PLACEHOLDER_RE = re.compile(r"\b(first|middle|last)\b", re.IGNORECASE)
+_WORD_RE = re.compile(r"[A-Za-z]+")
+_ATTACHMENT_NOISE_RE = re.compile(r"\bmay be attached\b|\bschedule\b", re.IGNORECASE)
+_AMOUNT_RE = re.compile(AMOUNT_RE)
+_FRAUD_RE = re.compile(r"\b(fraud|staged|inconsistent)\b", re.IGNORECASE)
+
+_FIELD_FLAGS = re.IGNORECASE | re.MULTILINE
+
+POLICY_NUMBER_PATTERNS = [
+    re.compile(r"\bPolicy\s*(?:Number|No\.?|#)\s*[:\-]?\s*([A-Z0-9][A-Z0-9\-\/]*)", _FIELD_FLAGS),
+    re.compile(r"\bPOLICY\s+NUMBER\s*[:\-]?\s*([A-Z0-9][A-Z0-9\-\/]*)", _FIELD_FLAGS),
+]
+
+POLICYHOLDER_NAME_PATTERNS = [
+    re.compile(r"\bPolicyholder\s*Name\s*[:\-]?\s*([A-Z][A-Za-z ,.'-]+)", _FIELD_FLAGS),
+    re.compile(r"\bPolicy\s*Holder\s*Name\s*[:\-]?\s*([A-Z][A-Za-z ,.'-]+)", _FIELD_FLAGS),
+    re.compile(r"\bName\s*of\s*Insured(?:\s*\(.*?\))?\s*[:\-]?\s*([A-Z][A-Za-z ,.'-]+)", _FIELD_FLAGS),
+    re.compile(r"\bNamed\s*Insured\s*[:\-]?\s*([A-Z][A-Za-z ,.'-]+)", _FIELD_FLAGS),
+    re.compile(r"\bInsured\s*Name\s*[:\-]?\s*([A-Z][A-Za-z ,.'-]+)", _FIELD_FLAGS),
+]
+
+INCIDENT_DATE_PATTERNS = [
+    re.compile(
+        rf"\b(?:Date\s*of\s*Loss|Loss\s*Date|Incident\s*Date|Accident\s*Date|Date\s*of\s*Incident)\s*[:\-]?\s*({DATE_RE})",
+        _FIELD_FLAGS,
+    ),
+]
+
+INCIDENT_TIME_PATTERNS = [
+    re.compile(
+        rf"\b(?:Time\s*of\s*Loss|Loss\s*Time|Incident\s*Time|Accident\s*Time|Time\s*of\s*Incident)\s*[:\-]?\s*({TIME_RE})",
+        _FIELD_FLAGS,
+    ),
+]
+
+COMBINED_DATETIME_PATTERN = re.compile(
+    rf"(?:Date\s*/\s*Time\s*of\s*Loss|Loss\s*Date\s*/\s*Time|Date\s*and\s*Time\s*of\s*Loss|"
+    rf"Incident\s*Date\s*/\s*Time|Date\s*Time\s*of\s*Incident)\s*[:\-]?\s*({DATE_RE})"
+    rf"(?:\s+|,?\s*)({TIME_RE})?",
+    re.IGNORECASE,
+)
+
+ESTIMATED_DAMAGE_PATTERNS = [
+    re.compile(
+        r"\b(?:Estimated\s*Damage|Estimated\s*Loss|Estimated\s*Amount|Damage\s*Estimate|Estimated\s*Cost|Total\s*Estimated\s*Damage|Estimate\s*Amount)\s*[:\-]?\s*([^\n]+)",
+        _FIELD_FLAGS,
+    ),
+    re.compile(r"\bESTIMATE\s*AMOUNT\s*[:\-]?\s*([^\n]+)", _FIELD_FLAGS),
+]
+
+INITIAL_ESTIMATE_PATTERNS = [
+    re.compile(
+        r"\b(?:Initial\s*Estimate|Initial\s*Loss\s*Estimate|Initial\s*Damage\s*Estimate)\s*[:\-]?\s*([^\n]+)",
+        _FIELD_FLAGS,
+    ),
+]
+
+CLAIM_TYPE_FALLBACK_PATTERN = re.compile(
+    r"\b(?:claim\s*type|type\s*of\s*claim|loss\s*type)\b[^\n]{0,40}\b(injury|bodily\s*injury|property\s*damage|collision|comprehensive|theft|fire|liability|vandalism|medical)\b",
+    re.IGNORECASE,
+)
+
+# Fallbacks for OCR'd PDFs whose labels carry a one-character typo
+# ("Polcy Number", "Insureed Name"). Only the long label forms are fuzzy:
+# a short one like "Policy #" would accept almost any word after "Policy".
+# Off by default: enabled with extract_fields(..., fuzzy_labels=True) or the
+# --fuzzy-labels CLI flag, it needs the third-party `regex` module, imported
+# and compiled on first use, and runs only for fields the exact patterns did
+# not find.
+FUZZY_LABEL_PATTERNS = {
+    "Policy Number": [
+        r"\b(?:Policy\s*Number){e<=1}\b\s*[:\-]?\s*([A-Z0-9][A-Z0-9\-\/]*)",
+    ],
+    "Policyholder Name": [
+        r"\b(?:Policyholder\s*Name){e<=1}\b\s*[:\-]?\s*([A-Z][A-Za-z ,.'-]+)",
+        r"\b(?:Named\s*Insured){e<=1}\b\s*[:\-]?\s*([A-Z][A-Za-z ,.'-]+)",
+        r"\b(?:Insured\s*Name){e<=1}\b\s*[:\-]?\s*([A-Z][A-Za-z ,.'-]+)",
+    ],
+    "Incident Date": [
+        rf"\b(?:Date\s*of\s*Loss|Incident\s*Date|Accident\s*Date){{e<=1}}\b\s*[:\-]?\s*({DATE_RE})",
+    ],
+    "Incident Time": [
+        rf"\b(?:Time\s*of\s*Loss|Incident\s*Time|Accident\s*Time){{e<=1}}\b\s*[:\-]?\s*({TIME_RE})",
+    ],
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _fuzzy_label_res():
+    try:
+        import regex
+    except ImportError:
+        raise RuntimeError("The regex package is required for fuzzy label matching.") from None
+    flags = regex.IGNORECASE | regex.MULTILINE | regex.ENHANCEMATCH
+    return {name: [regex.compile(p, flags) for p in patterns] for name, patterns in FUZZY_LABEL_PATTERNS.items()}
+
+# Fields resolved by scan_fields with extract_with_patterns semantics.
+PREFILTERED_FIELDS = {
+    "Policy Number": POLICY_NUMBER_PATTERNS,
+    "Policyholder Name": POLICYHOLDER_NAME_PATTERNS,
+    "Incident Date": INCIDENT_DATE_PATTERNS,
+    "Incident Time": INCIDENT_TIME_PATTERNS,
+    "Estimated Damage": ESTIMATED_DAMAGE_PATTERNS,
+    "Initial Estimate": INITIAL_ESTIMATE_PATTERNS,
+}
+
+# Every extract_with_patterns alternative wrapped in a zero-width lookahead, so
+# one finditer pass visits each position where any field label can match. All
+# field labels start at a word boundary with one of _FIELD_INITIALS; checking
+# that first lets the engine skip most positions cheaply.
+_FIELD_INITIALS = "adeilnpt"
+FIELD_ALTERNATIVES = [
+    (name, pat) for name, patterns in PREFILTERED_FIELDS.items() for pat in patterns
+]
+_FIELD_GROUPS = [f"{name.lower().replace(' ', '_')}_{i}" for i, (name, _) in enumerate(FIELD_ALTERNATIVES)]
+FIELDS_RE = re.compile(
+    rf"\b(?=[{_FIELD_INITIALS}])(?="
+    + "|".join(f"(?P<{group}>{pat.pattern})" for group, (_, pat) in zip(_FIELD_GROUPS, FIELD_ALTERNATIVES))
+    + ")",
+    _FIELD_FLAGS,
+)
+# field name -> its alternative indices, in priority order
+_FIELD_ALTERNATIVE_IDS = {
+    name: tuple(i for i, (alt_name, _) in enumerate(FIELD_ALTERNATIVES) if alt_name == name)
+    for name in PREFILTERED_FIELDS
+}
+# group name -> (alternative index, value group in FIELDS_RE, lower-priority
+# alternatives of the same field)
+_FIELD_SCAN_INFO = {
+    group: (
+        i,
+        FIELDS_RE.groupindex[group] + 1,
+        tuple(j for j in range(i + 1, len(FIELD_ALTERNATIVES)) if FIELD_ALTERNATIVES[j][0] == name),
+    )
+    for i, (group, (name, _)) in enumerate(zip(_FIELD_GROUPS, FIELD_ALTERNATIVES))
+}
+
+_LOOKAROUND_RE = re.compile(r"\(\?<?[=!]")
+_PY_CLASS_RE = re.compile(r"(?<!\\)\\[ds]")
+# RE2's \d and \s are ASCII-only; widen them to Python's Unicode semantics so
+# STOP_SET counts the same labels `re` would.
+_RE2_CLASSES = {
+    r"\d": r"\p{Nd}",
+    r"\s": r"[\s\v\x{1c}-\x{1f}\x{85}\pZ]",
+}
+# `re` with IGNORECASE matches "i" against U+0130 (İ) and U+0131 (ı); RE2 does
+# not. These are the only letters where the two disagree, so fold them before
+# matching. Each maps to one character, keeping match positions unchanged.
+_RE2_FOLD = str.maketrans("\u0130\u0131", "ii")
+
+
+def _re2_source(pat):
+    source = pat.pattern
+    if _LOOKAROUND_RE.search(source):
+        raise ValueError(f"Lookaround is not supported by RE2: {source!r}")
+    source = _PY_CLASS_RE.sub(lambda m: _RE2_CLASSES[m.group(0)], source)
+    inline = ("i" if pat.flags & re.IGNORECASE else "") + ("m" if pat.flags & re.MULTILINE else "")
+    return f"(?{inline}){source}" if inline else source
+
+
+def _re2_options():
+    options = re2.Options()
+    options.max_mem = 64 << 20
+    return options
+
+
+def _build_stop_set():
+    # RE2::Set reports every label that matches, overlapping ones included,
+    # in one scan; the same count the per-label loop produces.
+    if re2 is None:
+        return None
+    stop_set = re2.Set.SearchSet(_re2_options())
+    for pat in STOP_LABEL_PATTERNS:
+        stop_set.Add(_re2_source(pat))
+    stop_set.Compile()
+    return stop_set
+
+
+STOP_SET = _build_stop_set()
+
+LOCATION_LABELS = (
+    r"Incident\s*Location",
+    r"Location\s*of\s*Loss",
+    r"Loss\s*Location",
+    r"Accident\s*Location",
+    r"Street\s*:?,?\s*Location\s*of\s*Loss",
+    r"Address\s*of\s*Loss",
+    r"Loss\s*Address",
+)
+
+CITY_STATE_LABELS = (r"City\s*,?\s*State\s*,?\s*Zip",)
+
+DESCRIBE_LOCATION_LABELS = (
+    r"Describe\s*Location\s*of\s*Loss\s*If\s*Not\s*At\s*Specific\s*Street\s*Address",
+    r"Describe\s*Location\s*of\s*Loss",
+)
+
+DESCRIPTION_LABELS = (
+    r"Incident\s*Description",
+    r"Description\s*of\s*Loss",
+    r"Description\s*of\s*Accident",
+    r"Description\s*of\s*Incident",
+    r"Describe\s*Damage",
+    r"Describe\s*Property",
+)
+
+CLAIM_LABELS = (
+    r"Claim\s*Type",
+    r"Type\s*of\s*Claim",
+    r"Loss\s*Type",
+    r"Coverage\s*Type",
+    r"Type\s*of\s*Loss",
+)
+
+ATTACHMENT_LABELS = (
+    r"Attachments?",
+    r"Attachment\(s\)",
+    r"Documents\s*Attached",
+)
+
+
+def _iter_page_texts(pages):
+    for page in pages:
+        yield page.extract_text() or ""
+        # Drop the page's parsed layout objects once its text is out.
+        page.flush_cache()
+
+
+def _extract_page_range(path, start, stop):
+    with pdfplumber.open(path) as pdf:
+        return list(_iter_page_texts(pdf.pages[start:stop]))
+
+
+def extract_text_iter(path):
+    """Yield the text of each PDF page (or the whole TXT file) in order.
+
+    PDFs with more than PARALLEL_PAGE_THRESHOLD pages are split into
+    contiguous page ranges of at least MIN_PAGES_PER_WORKER pages, one per
+    CPU, and parsed in worker processes; pdfminer is pure Python, so threads
+    would serialize on the GIL. Smaller PDFs stream page by page in-process.
+    """
     ext = os.path.splitext(path)[1].lower()
     if ext == ".pdf":
         if pdfplumber is None:
             raise RuntimeError("pdfplumber is required to parse PDF files.")
-        parts = []
         with pdfplumber.open(path) as pdf:
-            for page in pdf.pages:
-                parts.append(page.extract_text() or "")
-        return "\n".join(parts)
+            n_pages = len(pdf.pages)
+            workers = min(os.cpu_count() or 1, n_pages // MIN_PAGES_PER_WORKER)
+            if n_pages <= PARALLEL_PAGE_THRESHOLD or workers < 2:
+                yield from _iter_page_texts(pdf.pages)
+                return
+        # Imported here: multiprocessing adds noticeably to CLI start-up and
+        # only large PDFs need it.
+        from concurrent.futures import ProcessPoolExecutor
+
+        bounds = [n_pages * i // workers for i in range(workers + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for texts in pool.map(_extract_page_range, itertools.repeat(path), bounds[:-1], bounds[1:]):
+                yield from texts
+        return
     if ext == ".txt":
         with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            return f.read()
+            yield f.read()
+        return
     raise ValueError("Unsupported file type. Use PDF or TXT.")
 
 
-def normalize_text(text):
+def extract_text(path):
+    return "\n".join(extract_text_iter(path))
+
+
+def normalize_text(text: str) -> str:
+    # Two substitutions with constant replacements stay in C; a single
+    # combined pattern needs a Python callback per match and is ~2x slower.
     text = text.replace("\r", "\n")
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{2,}", "\n", text)
+    text = _BLANKS_RE.sub(" ", text)
+    text = _NEWLINES_RE.sub("\n", text)
     return text.strip()
 
 
-def clean_value(val):
+def clean_value(val: Optional[str]) -> Optional[str]:
     if val is None:
         return None
-    val = re.sub(r"\s+", " ", val).strip()
-    val = val.strip(" :;-\t")
+    # After collapsing, the only whitespace left is " ", so one strip covers
+    # both the whitespace and the separator characters.
+    val = _WS_RE.sub(" ", val).strip(" :;-")
     if not val:
         return None
-    if val.lower() in MISSING_TOKENS:
+    if len(val) <= _MISSING_MAX_LEN and val.lower() in MISSING_TOKENS:
         return None
     return val
 
 
-def looks_like_label(value):
+def letter_counts(v: str) -> Tuple[int, int]:
+    if v.isascii():
+        # bytes.translate deletes in C; the length drop is the class count.
+        b = v.encode("ascii")
+        n = len(b)
+        return n - len(b.translate(None, _ASCII_LETTERS)), n - len(b.translate(None, _ASCII_UPPER))
+    n_letters = n_upper = 0
+    for c in v:
+        if c.isalpha():
+            n_letters += 1
+            if c.isupper():
+                n_upper += 1
+    return n_letters, n_upper
+
+
+def looks_like_label(value: Optional[str]) -> bool:
     if value is None:
         return False
     v = value.strip()
     if not v:
         return False
-    v_lower = v.lower()
-    for pat in PLACEHOLDER_PATTERNS:
-        if re.search(pat, v_lower):
-            return True
-    letters = [c for c in v if c.isalpha()]
-    if letters:
-        upper_ratio = sum(1 for c in letters if c.isupper()) / len(letters)
-        words = re.findall(r"[A-Z]{2,}", v)
-        if upper_ratio > 0.95 and len(words) >= 3:
+    if _PLACEHOLDER_COMBINED.search(v.lower()):
+        return True
+    n_letters, n_upper = letter_counts(v)
+    if n_letters and n_upper / n_letters > 0.95:
+        if len(_UPPER_RUN_RE.findall(v)) >= 3:
             return True
     return False
 
 
-def is_noise_value(value, max_len=200, label_hit_threshold=3):
+def is_noise_value(value: Optional[str], max_len: int = 200, label_hit_threshold: int = 3) -> bool:
     if value is None:
         return False
     v = value.strip()
@@ -141,32 +483,41 @@ def is_noise_value(value, max_len=200, label_hit_threshold=3):
         return False
     if len(v) > max_len:
         return True
-    if re.search(r"\bACORD\b", v, re.IGNORECASE):
+    if _ACORD_RE.search(v):
         return True
-    hits = sum(1 for label in STOP_LABELS if re.search(label, v, re.IGNORECASE))
-    if hits >= label_hit_threshold:
-        return True
-    return False
+    if STOP_SET is not None:
+        hits = len(STOP_SET.Match(v if v.isascii() else v.translate(_RE2_FOLD)) or ())
+    else:
+        hits = sum(1 for pat in STOP_LABEL_PATTERNS if pat.search(v))
+    return hits >= label_hit_threshold
 
 
-def validate_policy_number(value):
+def validate_policy_number(value: Optional[str]) -> Optional[str]:
     if value is None:
         return None
     if looks_like_label(value):
         return None
-    if not re.search(r"\d", value):
+    if not _DIGIT_RE.search(value):
         return None
     return value
 
 
-def validate_policyholder_name(value):
+def validate_policyholder_name(value: Optional[str]) -> Optional[str]:
     if value is None:
         return None
     if looks_like_label(value):
         return None
-    if re.search(r"\b(first|middle|last)\b", value, re.IGNORECASE):
+    if value.isascii():
+        b = value.encode("ascii").lower()
+        if not _NAME_PLACEHOLDER_WORDS.isdisjoint(b.translate(_NON_WORD_TO_SPACE).split()):
+            return None
+        tokens = b.translate(_NON_LETTER_TO_SPACE).split()
+        if len(tokens) < 2 or not _NAME_LABEL_WORDS.isdisjoint(tokens):
+            return None
+        return value
+    if _NAME_PLACEHOLDER_RE.search(value):
         return None
-    words = re.findall(r"[A-Za-z]+", value)
+    words = _WORD_RE.findall(value)
     if len(words) < 2:
         return None
     if any(w.lower() in {"insured", "policy", "name"} for w in words):
@@ -174,71 +525,37 @@ def validate_policyholder_name(value):
     return value
 
 
-def validate_location(value):
-    if value is None:
-        return None
-    if looks_like_label(value):
-        return None
-    if is_noise_value(value, max_len=180, label_hit_threshold=2):
-        return None
-    return value
-
-
-def validate_description(value):
-    if value is None:
-        return None
-    if looks_like_label(value):
-        return None
-    if is_noise_value(value, max_len=400, label_hit_threshold=3):
-        return None
-    return value
-
-
-def validate_claim_type(value):
-    if value is None:
-        return None
-    if looks_like_label(value):
-        return None
-    if is_noise_value(value, max_len=60, label_hit_threshold=2):
-        return None
-    return value
-
-
-def validate_attachments(value):
-    if value is None:
-        return None
-    if looks_like_label(value):
+def validate_field(
+    value: Optional[str],
+    max_len: int,
+    label_hit_threshold: int,
+    reject: Optional[Callable[[str], object]] = None,
+) -> Optional[str]:
+    if value is None or looks_like_label(value):
         return None
-    if re.search(r"\bmay be attached\b|\bschedule\b", value, re.IGNORECASE):
+    if is_noise_value(value, max_len=max_len, label_hit_threshold=label_hit_threshold):
         return None
-    if is_noise_value(value, max_len=120, label_hit_threshold=2):
+    if reject is not None and reject(value):
         return None
     return value
 
 
-def validate_amount_field(value):
-    if value is None:
-        return None
-    if looks_like_label(value):
-        return None
-    if is_noise_value(value, max_len=80, label_hit_threshold=2):
-        return None
-    if parse_amount(value) is None:
-        return None
-    return value
+def _not_an_amount(value: str) -> bool:
+    return parse_amount(value) is None
 
 
-def extract_with_patterns(patterns, text, flat_text=None, flags=re.IGNORECASE | re.MULTILINE):
+def extract_with_patterns(patterns, text, get_flat_text=None):
     for pat in patterns:
-        m = re.search(pat, text, flags)
+        m = pat.search(text)
         if m:
             val = clean_value(m.group(1))
             if val and looks_like_label(val):
                 continue
             return val
+    flat_text = get_flat_text() if get_flat_text else None
     if flat_text:
         for pat in patterns:
-            m = re.search(pat, flat_text, flags)
+            m = pat.search(flat_text)
             if m:
                 val = clean_value(m.group(1))
                 if val and looks_like_label(val):
@@ -247,16 +564,24 @@ def extract_with_patterns(patterns, text, flat_text=None, flags=re.IGNORECASE |
     return None
 
 
+@functools.lru_cache(maxsize=512)
+def _line_pattern(label):
+    return re.compile(rf"^\s*{label}\s*[:\-]?\s*([^\n]+)", _FIELD_FLAGS)
+
+
+@functools.lru_cache(maxsize=512)
+def _block_pattern(label, stop):
+    return re.compile(rf"{label}\s*[:\-]?\s*(.+?)(?=\n\s*(?:{stop})\b|\Z)", re.IGNORECASE | re.DOTALL)
+
+
 def extract_labeled_line(text, labels):
-    patterns = [rf"^\s*{label}\s*[:\-]?\s*([^\n]+)" for label in labels]
-    return extract_with_patterns(patterns, text, None, flags=re.IGNORECASE | re.MULTILINE)
+    return extract_with_patterns([_line_pattern(label) for label in labels], text)
 
 
-def extract_labeled_block(text, labels, stop_labels):
-    stop = "|".join(stop_labels)
+def extract_labeled_block(text, labels, stop_labels=STOP_LABELS):
+    stop = _STOP_JOINED if stop_labels is STOP_LABELS else "|".join(stop_labels)
     for label in labels:
-        pat = rf"{label}\s*[:\-]?\s*(.+?)(?=\n\s*(?:{stop})\b|\Z)"
-        m = re.search(pat, text, re.IGNORECASE | re.DOTALL)
+        m = _block_pattern(label, stop).search(text)
         if m:
             val = clean_value(m.group(1))
             if val and looks_like_label(val):
@@ -265,10 +590,19 @@ def extract_labeled_block(text, labels, stop_labels):
     return None
 
 
-def parse_amount(val):
+# route_claim re-parses the amount validate_field already parsed through _not_an_amount.
+@functools.lru_cache(maxsize=128)
+def parse_amount(val: Optional[str]) -> Optional[float]:
     if val is None:
         return None
-    m = re.search(AMOUNT_RE, val)
+    # Fast path for a bare whole-number amount ("18000", "$ 18000"), the usual
+    # form on FNOL forms; anything else goes through AMOUNT_RE.
+    s = val.strip()
+    if s.startswith("$"):
+        s = s[1:].lstrip()
+    if s.isascii() and s.isdigit():
+        return float(s)
+    m = _AMOUNT_RE.search(val)
     if not m:
         return None
     num = m.group(1).replace(",", "")
@@ -279,70 +613,101 @@ def parse_amount(val):
 
 
 def extract_combined_datetime(text):
-    pat = (
-        rf"(?:Date\s*/\s*Time\s*of\s*Loss|Loss\s*Date\s*/\s*Time|Date\s*and\s*Time\s*of\s*Loss|"
-        rf"Incident\s*Date\s*/\s*Time|Date\s*Time\s*of\s*Incident)\s*[:\-]?\s*({DATE_RE})"
-        rf"(?:\s+|,?\s*)({TIME_RE})?"
-    )
-    m = re.search(pat, text, re.IGNORECASE)
+    m = COMBINED_DATETIME_PATTERN.search(text)
     if m:
         return clean_value(m.group(1)), clean_value(m.group(2))
     return None, None
 
 
-def extract_fields(text):
-    normalized = normalize_text(text)
-    flat_text = re.sub(r"\s+", " ", normalized).strip()
-
-    fields = {
-        "Policy Number": None,
-        "Policyholder Name": None,
-        "Incident Date": None,
-        "Incident Time": None,
-        "Incident Location": None,
-        "Incident Description": None,
-        "Claim Type": None,
-        "Estimated Damage": None,
-        "Attachments": None,
-        "Initial Estimate": None,
-    }
-
-    fields["Policy Number"] = extract_with_patterns(
-        [
-            r"\bPolicy\s*(?:Number|No\.?|#)\s*[:\-]?\s*([A-Z0-9][A-Z0-9\-\/]*)",
-            r"\bPOLICY\s+NUMBER\s*[:\-]?\s*([A-Z0-9][A-Z0-9\-\/]*)",
-        ],
-        normalized,
-        flat_text,
-    )
-
-    fields["Policyholder Name"] = extract_with_patterns(
-        [
-            r"\bPolicyholder\s*Name\s*[:\-]?\s*([A-Z][A-Za-z ,.'-]+)",
-            r"\bPolicy\s*Holder\s*Name\s*[:\-]?\s*([A-Z][A-Za-z ,.'-]+)",
-            r"\bName\s*of\s*Insured(?:\s*\(.*?\))?\s*[:\-]?\s*([A-Z][A-Za-z ,.'-]+)",
-            r"\bNamed\s*Insured\s*[:\-]?\s*([A-Z][A-Za-z ,.'-]+)",
-            r"\bInsured\s*Name\s*[:\-]?\s*([A-Z][A-Za-z ,.'-]+)",
-        ],
-        normalized,
-        flat_text,
-    )
-
-    fields["Incident Date"] = extract_with_patterns(
-        [
-            rf"\b(?:Date\s*of\s*Loss|Loss\s*Date|Incident\s*Date|Accident\s*Date|Date\s*of\s*Incident)\s*[:\-]?\s*({DATE_RE})",
-        ],
-        normalized,
-        flat_text,
-    )
+def _settle_fields(queues, first, results, exhausted=False):
+    """Resolve every field whose outcome no longer depends on unseen text.
 
-    fields["Incident Time"] = extract_with_patterns(
-        [
-            rf"\b(?:Time\s*of\s*Loss|Loss\s*Time|Incident\s*Time|Accident\s*Time|Time\s*of\s*Incident)\s*[:\-]?\s*({TIME_RE})",
-        ],
-        normalized,
-        flat_text,
-    )
+    A field is settled once its alternatives have been seen in priority order
+    up to the first whose value is not a label. When the text is exhausted,
+    alternatives that never matched are simply skipped.
+    """
+    for name in list(queues):
+        queue = queues[name]
+        while queue and (exhausted or queue[0] in first):
+            i = queue.pop(0)
+            if i not in first:
+                continue
+            val = clean_value(first[i])
+            if val and looks_like_label(val):
+                continue
+            results[name] = val
+            break
+        if name in results or not queue:
+            del queues[name]
+    return not queues
+
+
+def scan_fields(text, names):
+    """Resolve the given fields exactly as extract_with_patterns would, in one pass.
+
+    Returns only fields whose patterns matched; a resolved value may be None
+    (e.g. "N/A"), which like extract_with_patterns suppresses the fallback.
+    The scan stops as soon as every requested field is settled.
+    """
+    queues = {name: list(_FIELD_ALTERNATIVE_IDS[name]) for name in names if name in _FIELD_ALTERNATIVE_IDS}
+    if not queues:
+        return {}
+    wanted = {i for queue in queues.values() for i in queue}
+    first = {}
+    results = {}
+    for m in FIELDS_RE.finditer(text):
+        i, value_group, siblings = _FIELD_SCAN_INFO[m.lastgroup]
+        if i in wanted and i not in first:
+            first[i] = m.group(value_group)
+        # The alternation only reports the first alternative matching here.
+        # Labels of different fields never start at the same position, but a
+        # lower-priority alternative of the same field may.
+        for j in siblings:
+            if j in wanted and j not in first:
+                hit = FIELD_ALTERNATIVES[j][1].match(text, m.start())
+                if hit:
+                    first[j] = hit.group(1)
+        if _settle_fields(queues, first, results):
+            return results
+    _settle_fields(queues, first, results, exhausted=True)
+    return results
+
+
+# field -> (max_len, label_hit_threshold, extra reject predicate) for
+# validate_field. Policy number and policyholder name have their own rules.
+FIELD_VALIDATION = {
+    "Incident Location": (180, 2, None),
+    "Incident Description": (400, 3, None),
+    "Claim Type": (60, 2, None),
+    "Estimated Damage": (80, 2, _not_an_amount),
+    "Initial Estimate": (80, 2, _not_an_amount),
+    "Attachments": (120, 2, _ATTACHMENT_NOISE_RE.search),
+}
+
+
+def extract_fields(text, fuzzy_labels=False):
+    fuzzy_res = _fuzzy_label_res() if fuzzy_labels else {}
+    normalized = normalize_text(text)
+    flat = None
+
+    def flat_text():
+        # Whitespace-collapsed copy for labels split across lines; only built
+        # when some field is not found in the normalized text.
+        nonlocal flat
+        if flat is None:
+            flat = _WS_RE.sub(" ", normalized).strip()
+        return flat
+
+    fields = dict.fromkeys(FIELD_NAMES)
+
+    found = scan_fields(normalized, PREFILTERED_FIELDS)
+    unresolved = set(PREFILTERED_FIELDS).difference(found)
+    if unresolved and normalized:
+        found.update(scan_fields(flat_text(), unresolved))
+    fields.update(found)
+    for name, patterns in fuzzy_res.items():
+        if name not in found:
+            fields[name] = extract_with_patterns(patterns, normalized, flat_text)
 
     if fields["Incident Date"] is None or fields["Incident Time"] is None:
         combo_date, combo_time = extract_combined_datetime(normalized)
@@ -351,132 +716,84 @@ def extract_fields(text):
         if fields["Incident Time"] is None:
             fields["Incident Time"] = combo_time
 
-    location_labels = [
-        r"Incident\s*Location",
-        r"Location\s*of\s*Loss",
-        r"Loss\s*Location",
-        r"Accident\s*Location",
-        r"Street\s*:?,?\s*Location\s*of\s*Loss",
-        r"Address\s*of\s*Loss",
-        r"Loss\s*Address",
-    ]
-    street = extract_labeled_line(normalized, location_labels)
-    city_state = extract_labeled_line(normalized, [r"City\s*,?\s*State\s*,?\s*Zip"])
-    desc_loc = extract_labeled_block(
-        normalized,
-        [
-            r"Describe\s*Location\s*of\s*Loss\s*If\s*Not\s*At\s*Specific\s*Street\s*Address",
-            r"Describe\s*Location\s*of\s*Loss",
-        ],
-        STOP_LABELS,
-    )
+    street = extract_labeled_line(normalized, LOCATION_LABELS)
+    city_state = extract_labeled_line(normalized, CITY_STATE_LABELS)
+    desc_loc = extract_labeled_block(normalized, DESCRIBE_LOCATION_LABELS, STOP_LABELS)
     if street or city_state or desc_loc:
         parts = [p for p in [street, city_state, desc_loc] if p]
         fields["Incident Location"] = ", ".join(parts) if parts else None
     else:
-        fields["Incident Location"] = extract_labeled_block(normalized, location_labels, STOP_LABELS)
-
-    description_labels = [
-        r"Incident\s*Description",
-        r"Description\s*of\s*Loss",
-        r"Description\s*of\s*Accident",
-        r"Description\s*of\s*Incident",
-        r"Describe\s*Damage",
-        r"Describe\s*Property",
-    ]
-    fields["Incident Description"] = extract_labeled_block(normalized, description_labels, STOP_LABELS)
-
-    claim_labels = [
-        r"Claim\s*Type",
-        r"Type\s*of\s*Claim",
-        r"Loss\s*Type",
-        r"Coverage\s*Type",
-        r"Type\s*of\s*Loss",
-    ]
-    fields["Claim Type"] = extract_labeled_line(normalized, claim_labels)
+        fields["Incident Location"] = extract_labeled_block(normalized, LOCATION_LABELS, STOP_LABELS)
+
+    fields["Incident Description"] = extract_labeled_block(normalized, DESCRIPTION_LABELS, STOP_LABELS)
+
+    fields["Claim Type"] = extract_labeled_line(normalized, CLAIM_LABELS)
     if fields["Claim Type"] is None:
-        m = re.search(
-            r"\b(?:claim\s*type|type\s*of\s*claim|loss\s*type)\b[^\n]{0,40}\b(injury|bodily\s*injury|property\s*damage|collision|comprehensive|theft|fire|liability|vandalism|medical)\b",
-            flat_text,
-            re.IGNORECASE,
-        )
+        m = CLAIM_TYPE_FALLBACK_PATTERN.search(flat_text())
         if m:
             fields["Claim Type"] = clean_value(m.group(1))
 
-    fields["Estimated Damage"] = extract_with_patterns(
-        [
-            r"\b(?:Estimated\s*Damage|Estimated\s*Loss|Estimated\s*Amount|Damage\s*Estimate|Estimated\s*Cost|Total\s*Estimated\s*Damage|Estimate\s*Amount)\s*[:\-]?\s*([^\n]+)",
-            r"\bESTIMATE\s*AMOUNT\s*[:\-]?\s*([^\n]+)",
-        ],
-        normalized,
-        flat_text,
-    )
-
-    fields["Initial Estimate"] = extract_with_patterns(
-        [
-            r"\b(?:Initial\s*Estimate|Initial\s*Loss\s*Estimate|Initial\s*Damage\s*Estimate)\s*[:\-]?\s*([^\n]+)",
-        ],
-        normalized,
-        flat_text,
-    )
-
-    attachment_labels = [
-        r"Attachments?",
-        r"Attachment\(s\)",
-        r"Documents\s*Attached",
-    ]
-    fields["Attachments"] = extract_labeled_line(normalized, attachment_labels)
+    fields["Attachments"] = extract_labeled_line(normalized, ATTACHMENT_LABELS)
     if fields["Attachments"] is None:
-        fields["Attachments"] = extract_labeled_block(normalized, attachment_labels, STOP_LABELS)
+        fields["Attachments"] = extract_labeled_block(normalized, ATTACHMENT_LABELS, STOP_LABELS)
 
     fields["Policy Number"] = validate_policy_number(fields["Policy Number"])
     fields["Policyholder Name"] = validate_policyholder_name(fields["Policyholder Name"])
-    fields["Incident Location"] = validate_location(fields["Incident Location"])
-    fields["Incident Description"] = validate_description(fields["Incident Description"])
-    fields["Claim Type"] = validate_claim_type(fields["Claim Type"])
-    fields["Estimated Damage"] = validate_amount_field(fields["Estimated Damage"])
-    fields["Initial Estimate"] = validate_amount_field(fields["Initial Estimate"])
-    fields["Attachments"] = validate_attachments(fields["Attachments"])
+    for name, (max_len, label_hit_threshold, reject) in FIELD_VALIDATION.items():
+        fields[name] = validate_field(fields[name], max_len, label_hit_threshold, reject)
 
     return fields
 
 
 def route_claim(fields):
-    mandatory = [
-        "Policy Number",
-        "Policyholder Name",
-        "Incident Date",
-        "Incident Location",
-        "Claim Type",
-        "Estimated Damage",
-    ]
-
-    missing_fields = [f for f in mandatory if not fields.get(f)]
+    missing_fields = [f for f in MANDATORY_FIELDS if not fields.get(f)]
 
     if missing_fields:
         return missing_fields, "Manual Review", "Missing mandatory field(s): " + ", ".join(missing_fields)
 
-    desc = (fields.get("Incident Description") or "").lower()
-    claim_type = (fields.get("Claim Type") or "").lower()
-    est_damage_value = parse_amount(fields.get("Estimated Damage"))
-
-    if re.search(r"\b(fraud|staged|inconsistent)\b", desc, re.IGNORECASE):
+    # _FRAUD_RE is case-insensitive, so the description is not lowercased.
+    if _FRAUD_RE.search(fields.get("Incident Description") or ""):
         return missing_fields, "Investigation Flag", "Incident description contains fraud indicators."
 
-    if "injury" in claim_type:
+    if "injury" in (fields.get("Claim Type") or "").lower():
         return missing_fields, "Specialist Queue", "Claim type is injury."
 
+    est_damage_value = parse_amount(fields.get("Estimated Damage"))
     if est_damage_value is not None and est_damage_value < 25000:
         return missing_fields, "Fast-track", "Estimated damage below 25000."
 
     return missing_fields, "Standard Processing", "All mandatory fields present and no special routing rules matched."
 
 
+def write_json(obj):
+    # orjson emits UTF-8 bytes; writing them to the binary buffer keeps a
+    # non-UTF-8 stdout encoding (e.g. cp1252 when redirected on Windows) from
+    # failing on non-ASCII values.
+    if orjson is not None and hasattr(sys.stdout, "buffer"):
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        sys.stdout.buffer.flush()
+        return
+    print(json.dumps(obj, indent=2))
+
+
 def main():
     ap = argparse.ArgumentParser(description="Rule-based FNOL claims processing agent")
     ap.add_argument("input_path", help="Path to FNOL PDF or TXT")
+    ap.add_argument(
+        "--fuzzy-labels",
+        action="store_true",
+        help="Also match labels with a one-character OCR typo (requires the regex package)",
+    )
     args = ap.parse_args()
 
+    if args.fuzzy_labels:
+        try:
+            _fuzzy_label_res()
+        except RuntimeError as e:
+            print(str(e), file=sys.stderr)
+            sys.exit(1)
+
     if not os.path.isfile(args.input_path):
         print("Input file not found.", file=sys.stderr)
         sys.exit(1)
@@ -487,7 +804,7 @@ def main():
         print(str(e), file=sys.stderr)
         sys.exit(1)
 
-    fields = extract_fields(raw_text)
+    fields = extract_fields(raw_text, fuzzy_labels=args.fuzzy_labels)
     missing_fields, route, reasoning = route_claim(fields)
 
     output = {
@@ -497,7 +814,7 @@ def main():
         "reasoning": reasoning,
     }
 
-    print(json.dumps(output, indent=2))
+    write_json(output)
 
 
 if __name__ == "__main__":
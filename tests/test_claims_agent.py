@@ -0,0 +1,190 @@
+import random
+import unittest
+from unittest import mock
+
+import claims_agent
+from claims_agent import (
+    FIELD_ALTERNATIVES,
+    PREFILTERED_FIELDS,
+    _FIELD_ALTERNATIVE_IDS,
+    _settle_fields,
+    extract_with_patterns,
+    parse_amount,
+    route_claim,
+    scan_fields,
+)
+
+# One sample per label spelling in PREFILTERED_FIELDS.
+FIELD_LABEL_SAMPLES = (
+    ("Policy Number", "Policy Number: AB-1"),
+    ("Policy Number", "Policy No. AB-1"),
+    ("Policy Number", "Policy # AB-1"),
+    ("Policy Number", "POLICY NUMBER AB-1"),
+    ("Policyholder Name", "Policyholder Name: Ann Lee"),
+    ("Policyholder Name", "Policy Holder Name: Ann Lee"),
+    ("Policyholder Name", "Name of Insured (First, Last): Ann Lee"),
+    ("Policyholder Name", "Named Insured: Ann Lee"),
+    ("Policyholder Name", "Insured Name: Ann Lee"),
+    ("Incident Date", "Date of Loss: 01/02/2024"),
+    ("Incident Date", "Loss Date: 2024-01-02"),
+    ("Incident Date", "Incident Date: March 3, 2024"),
+    ("Incident Date", "Accident Date: 3 Mar 2024"),
+    ("Incident Date", "Date of Incident: 1/2/24"),
+    ("Incident Time", "Time of Loss: 10:15 PM"),
+    ("Incident Time", "Loss Time: 9 AM"),
+    ("Incident Time", "Incident Time: 23:59"),
+    ("Incident Time", "Accident Time: 7:05"),
+    ("Incident Time", "Time of Incident: 11 PM"),
+    ("Estimated Damage", "Estimated Damage: $4,500"),
+    ("Estimated Damage", "Estimated Loss: 1200"),
+    ("Estimated Damage", "Estimated Amount: $300.00"),
+    ("Estimated Damage", "Damage Estimate: 900"),
+    ("Estimated Damage", "Estimated Cost: 45000"),
+    ("Estimated Damage", "Total Estimated Damage: $10,000"),
+    ("Estimated Damage", "Estimate Amount: 750"),
+    ("Estimated Damage", "ESTIMATE AMOUNT: 750"),
+    ("Initial Estimate", "Initial Estimate: $1,200"),
+    ("Initial Estimate", "Initial Loss Estimate: 800"),
+    ("Initial Estimate", "Initial Damage Estimate: 650"),
+)
+
+# Labels whose value is itself a label, so extract_with_patterns skips them.
+LABEL_VALUED_LINES = (
+    "Policy Number: PHONE",
+    "Policyholder Name: FIRST MIDDLE LAST",
+    "Named Insured: Policy Number",
+    "Estimated Damage: Claim Type",
+    "Initial Estimate: Estimated Damage",
+)
+
+FILLER_LINES = ("Claim Type: collision", "Remarks:", "N/A", "Policy", "Date", "Insured")
+
+
+def expected_fields(text, names=PREFILTERED_FIELDS):
+    return {name: extract_with_patterns(PREFILTERED_FIELDS[name], text) for name in names}
+
+
+def scanned_fields(text, names=PREFILTERED_FIELDS):
+    found = scan_fields(text, names)
+    return {name: found.get(name) for name in names}
+
+
+class CountingPattern:
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.matches = 0
+
+    def finditer(self, text):
+        for m in self.pattern.finditer(text):
+            self.matches += 1
+            yield m
+
+
+class FieldLabelTests(unittest.TestCase):
+    def test_labels_of_different_fields_never_start_at_the_same_position(self):
+        # FIELDS_RE reports one alternative per position; scan_fields only
+        # re-checks siblings of the same field there.
+        for name, sample in FIELD_LABEL_SAMPLES:
+            owners = {owner for owner, pat in FIELD_ALTERNATIVES if pat.match(sample)}
+            self.assertEqual(owners, {name}, sample)
+
+    def test_every_field_pattern_has_a_label_sample(self):
+        covered = {
+            i for _, sample in FIELD_LABEL_SAMPLES for i, (_, pat) in enumerate(FIELD_ALTERNATIVES) if pat.match(sample)
+        }
+        self.assertEqual(covered, set(range(len(FIELD_ALTERNATIVES))))
+
+
+class ScanFieldsTests(unittest.TestCase):
+    def test_matches_extract_with_patterns_on_label_samples(self):
+        samples = [sample for _, sample in FIELD_LABEL_SAMPLES]
+        for text in ("\n".join(samples), "\n".join(reversed(samples)), " ".join(samples)):
+            self.assertEqual(scanned_fields(text), expected_fields(text))
+
+    def test_matches_extract_with_patterns_on_shuffled_documents(self):
+        rnd = random.Random(0)
+        pool = [sample for _, sample in FIELD_LABEL_SAMPLES] + list(LABEL_VALUED_LINES) + list(FILLER_LINES)
+        for _ in range(500):
+            lines = rnd.sample(pool, rnd.randint(0, len(pool)))
+            text = rnd.choice(("\n", " ")).join(lines)
+            self.assertEqual(scanned_fields(text), expected_fields(text), text)
+            names = rnd.sample(sorted(PREFILTERED_FIELDS), rnd.randint(1, len(PREFILTERED_FIELDS)))
+            self.assertEqual(scanned_fields(text, names), expected_fields(text, names), text)
+
+    def test_skips_label_valued_higher_priority_alternative(self):
+        text = "Policyholder Name: FIRST MIDDLE LAST\nInsured Name: Ann Lee"
+        self.assertEqual(scan_fields(text, ["Policyholder Name"]), {"Policyholder Name": "Ann Lee"})
+
+    def test_later_higher_priority_alternative_wins(self):
+        text = "Insured Name: Bob Roe\nPolicyholder Name: Ann Lee"
+        self.assertEqual(scan_fields(text, ["Policyholder Name"]), {"Policyholder Name": "Ann Lee"})
+
+    def test_stops_once_requested_fields_are_settled(self):
+        text = "Policy Number: AB-1\nPolicy Number: CD-2\nIncident Date: 01/02/2024"
+        counting = CountingPattern(claims_agent.FIELDS_RE)
+        with mock.patch.object(claims_agent, "FIELDS_RE", counting):
+            self.assertEqual(scan_fields(text, ["Policy Number"]), {"Policy Number": "AB-1"})
+        self.assertEqual(counting.matches, 1)
+
+    def test_waits_for_higher_priority_alternative(self):
+        text = "Insured Name: Bob Roe\nIncident Date: 01/02/2024\nPolicyholder Name: Ann Lee"
+        counting = CountingPattern(claims_agent.FIELDS_RE)
+        with mock.patch.object(claims_agent, "FIELDS_RE", counting):
+            self.assertEqual(scan_fields(text, ["Policyholder Name"]), {"Policyholder Name": "Ann Lee"})
+        self.assertEqual(counting.matches, 3)
+
+
+class SettleFieldsTests(unittest.TestCase):
+    def setUp(self):
+        self.ids = _FIELD_ALTERNATIVE_IDS["Policyholder Name"]
+        self.queues = {"Policyholder Name": list(self.ids)}
+        self.results = {}
+
+    def test_waits_for_unseen_higher_priority_alternative(self):
+        first = {self.ids[1]: "Ann Lee"}
+        self.assertFalse(_settle_fields(self.queues, first, self.results))
+        self.assertEqual(self.results, {})
+        first[self.ids[0]] = "FIRST MIDDLE LAST"
+        self.assertTrue(_settle_fields(self.queues, first, self.results))
+        self.assertEqual(self.results, {"Policyholder Name": "Ann Lee"})
+
+    def test_exhausted_text_skips_unmatched_alternatives(self):
+        first = {self.ids[2]: "Bob Roe"}
+        self.assertTrue(_settle_fields(self.queues, first, self.results, exhausted=True))
+        self.assertEqual(self.results, {"Policyholder Name": "Bob Roe"})
+
+    def test_only_label_values_leave_field_unresolved(self):
+        first = {i: "Policy Number" for i in self.ids}
+        self.assertTrue(_settle_fields(self.queues, first, self.results))
+        self.assertEqual(self.results, {})
+
+
+class AmountTests(unittest.TestCase):
+    def test_parse_amount(self):
+        cases = {
+            "45000": 45000.0,
+            "$ 18000": 18000.0,
+            "$45000.00": 45000.0,
+            "$30,500.00": 30500.0,
+            "1,200": 1200.0,
+            "500": 500.0,
+            "N/A": None,
+        }
+        for value, expected in cases.items():
+            self.assertEqual(parse_amount(value), expected, value)
+
+    def test_comma_less_amount_at_threshold_is_not_fast_tracked(self):
+        fields = {
+            "Policy Number": "AB-1",
+            "Policyholder Name": "Ann Lee",
+            "Incident Date": "01/02/2024",
+            "Incident Location": "12 Main St",
+            "Claim Type": "collision",
+            "Estimated Damage": "45000",
+        }
+        self.assertEqual(route_claim(fields)[1], "Standard Processing")
+        self.assertEqual(route_claim(dict(fields, **{"Estimated Damage": "24999"}))[1], "Fast-track")
+
+
+if __name__ == "__main__":
+    unittest.main()